@@ -0,0 +1 @@
+"""Lets the tests import main.py from the repository root."""
@@ -1,15 +1,105 @@
 import streamlit as st
 import tempfile
 import os
+import hashlib
+import shutil
+import sys
 from pathlib import Path
+import atexit
+import functools
 import io
-from PIL import Image
+import json
+import logging
+import multiprocessing
+import queue
+from collections import deque
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 import fitz  # PyMuPDF
 from docx import Document
 import easyocr
 import numpy as np
+import torch
+from numba import njit
 import zipfile
 
+logger = logging.getLogger(__name__)
+
+# Target render resolution, lowered per page so the longest side stays within RENDER_MAX_SIDE_PX
+RENDER_TARGET_DPI = 144
+RENDER_MAX_SIDE_PX = 1600
+
+# On-disk cache of extracted text, keyed by PDF content hash
+OCR_CACHE_DIR = Path(tempfile.gettempdir()) / "ocr_cache"
+
+# Render pages as single-channel grayscale (a third of the bytes of RGB)
+GRAYSCALE = True
+
+# Stretch page contrast between these intensity percentiles before OCR
+CONTRAST_STRETCH = True
+CONTRAST_PERCENTILES = (2, 98)
+
+# Pages whose embedded text layer has at least this many characters, mostly letters, skip OCR
+TEXT_LAYER_MIN_CHARS = 40
+TEXT_LAYER_MIN_ALPHA_RATIO = 0.5
+
+# Pages per OCR batch and tiles per readtext_batched call on CPU, and the most used on GPU
+OCR_BATCH_SIZE_CPU = 4
+OCR_BATCH_SIZE_GPU = 16
+# Rough peak GPU memory of the detector per tile (GB), used to size GPU batches to free memory
+OCR_GPU_GB_PER_TILE = 1.5
+
+# Pages are cut into fixed-size, overlapping tiles so every batch forms a single detector tensor.
+# Tiles are wider than a rendered portrait page, so those are only cut between lines.
+OCR_TILE_HEIGHT = 960
+OCR_TILE_WIDTH = 1280
+OCR_TILE_OVERLAP = 0.1
+# Boxes reaching this close to a tile edge with a neighbouring tile past it may be cut off (px)
+OCR_TILE_EDGE_MARGIN = 4
+# Boxes overlapping vertically by at least this share of the smaller height are on one line
+OCR_LINE_OVERLAP = 0.5
+# Boxes on one line further apart than this many box heights are in separate columns
+OCR_COLUMN_GAP = 2.0
+# Gaps between lines taller than this many median line heights start a new paragraph
+OCR_PARAGRAPH_GAP = 1.0
+
+# Worker processes used to rasterize page ranges in parallel
+RENDER_WORKERS = os.cpu_count() or 1
+# PDFs with fewer pages are rendered in-process
+PARALLEL_RENDER_MIN_PAGES = 4
+# Pages per render task; tasks are submitted only as the consumer pulls pages
+RENDER_RANGE_PAGES = 2
+# Rendered pages queued, running or waiting in shared memory at once for one PDF
+RENDER_MAX_PAGES_IN_FLIGHT = 8
+# Shared memory is backed by /dev/shm, which containers often limit to 64 MB;
+# writing past its end kills the worker with SIGBUS, so keep this much free
+SHM_DIR = "/dev/shm"
+SHM_HEADROOM_BYTES = 8 * 2 ** 20
+
+# Most worker processes used to OCR uploaded files on CPU next to the file the app OCRs itself
+FILE_WORKERS = min(4, max(1, (os.cpu_count() or 1) - 1))
+# Rough peak memory of one file worker: its own EasyOCR models plus CPU tile batches (GB)
+FILE_WORKER_MEMORY_GB = 2.5
+
+# Bounded queue depth between the render, OCR and DOCX pipeline stages
+PIPELINE_QUEUE_SIZE = 8
+# Longest the OCR stage waits for more pages before running a partial batch (seconds)
+OCR_BATCH_TIMEOUT = 0.2
+# How often blocked pipeline stages check for cancellation (seconds)
+PIPELINE_POLL_INTERVAL = 0.1
+
+# Sentinel marking the end of a pipeline queue
+_PIPELINE_DONE = object()
+
+# EasyOCR reader of a file worker process, loaded on first use
+_worker_reader = None
+# PDF opened by a render worker process for its current file, as (path, document)
+_worker_pdf = None
+
 # Translation dictionary
 TRANSLATIONS = {
     "en": {
@@ -19,6 +109,17 @@ TRANSLATIONS = {
         "loading_model": "Loading OCR model... (This may take a moment on first run)",
         "model_load_error": "❌ Failed to load OCR reader. Please refresh the page and try again.",
         "model_loaded": "✅ OCR model loaded successfully!",
+        "use_gpu_label": "⚡ Use GPU",
+        "use_gpu_help": "Run OCR on the GPU when one is available. Uncheck to force CPU.",
+        "gpu_unavailable": "No GPU detected, running on CPU",
+        "color_mode_label": "🎨 Color mode",
+        "color_mode_help": "Render pages in color instead of grayscale. Slower, rarely improves recognition.",
+        "clear_cache": "🧹 Clear OCR cache",
+        "cache_cleared": "OCR cache cleared",
+        "cache_hit": "♻️ This PDF was processed before, using cached OCR result",
+        "advanced_settings": "⚙️ Advanced",
+        "rec_batch_size_label": "Recognizer batch size",
+        "rec_batch_size_help": "Text boxes recognized per forward pass. 0 = automatic (by free GPU memory, 1 on CPU).",
         "instructions_title": "ℹ️ Instructions",
         "instructions_content": """
         1. **Upload PDFs**: Drag and drop or browse to select one or multiple PDF files
@@ -67,6 +168,17 @@ TRANSLATIONS = {
         "loading_model": "OCR-Modell wird geladen... (Dies kann beim ersten Start einen Moment dauern)",
         "model_load_error": "❌ OCR-Modell konnte nicht geladen werden. Bitte aktualisieren Sie die Seite und versuchen Sie es erneut.",
         "model_loaded": "✅ OCR-Modell erfolgreich geladen!",
+        "use_gpu_label": "⚡ GPU verwenden",
+        "use_gpu_help": "OCR auf der GPU ausführen, falls verfügbar. Deaktivieren, um die CPU zu erzwingen.",
+        "gpu_unavailable": "Keine GPU gefunden, OCR läuft auf der CPU",
+        "color_mode_label": "🎨 Farbmodus",
+        "color_mode_help": "Seiten in Farbe statt in Graustufen rendern. Langsamer, verbessert die Erkennung selten.",
+        "clear_cache": "🧹 OCR-Cache leeren",
+        "cache_cleared": "OCR-Cache geleert",
+        "cache_hit": "♻️ Diese PDF wurde bereits verarbeitet, zwischengespeichertes OCR-Ergebnis wird verwendet",
+        "advanced_settings": "⚙️ Erweitert",
+        "rec_batch_size_label": "Batchgröße der Texterkennung",
+        "rec_batch_size_help": "Textboxen pro Durchlauf der Texterkennung. 0 = automatisch (nach freiem GPU-Speicher, 1 auf der CPU).",
         "instructions_title": "ℹ️ Anleitung",
         "instructions_content": """
         1. **PDFs hochladen**: Ziehen Sie PDF-Dateien per Drag & Drop hierher oder wählen Sie eine oder mehrere Dateien aus
@@ -125,108 +237,824 @@ def get_text(key, lang="en"):
     return TRANSLATIONS.get(lang, TRANSLATIONS["en"]).get(key, key)
 
 
+def _pick_device():
+    """Detect the best available torch device"""
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _warm_up_reader(reader):
+    """Run dummy inputs through the reader so the first real batch skips cuDNN autotuning"""
+    try:
+        # Autotuning is per input shape, so warm up with the tile batches real pages use
+        if reader.device != "cpu":
+            dummy = np.zeros((OCR_TILE_HEIGHT, OCR_TILE_WIDTH), dtype=np.uint8)
+            perform_ocr_easyocr([dummy] * default_batch_size(reader), reader)
+
+        # Warm the non-batched path too
+        reader.readtext(np.zeros((600, 800, 3), dtype=np.uint8))
+    except Exception as e:
+        logger.warning("OCR reader warm-up failed: %s", e)
+        st.warning(f"OCR reader warm-up failed, the first pages may be slow or fail: {str(e)}")
+
+
 @st.cache_resource
-def load_ocr_reader():
+def load_ocr_reader(use_gpu=True):
     """Load EasyOCR reader (cached to avoid reloading)"""
+    device = _pick_device() if use_gpu else "cpu"
     try:
-        reader = easyocr.Reader(['en', 'de'])  # English and German support
+        try:
+            # English and German support
+            reader = easyocr.Reader(['en', 'de'], gpu=(device != "cpu"), cudnn_benchmark=True)
+        except RuntimeError as e:
+            # CUDA OOM / driver errors surface as RuntimeError, retry on CPU
+            if device == "cpu":
+                raise
+            st.warning(f"GPU initialization failed, falling back to CPU: {str(e)}")
+            reader = easyocr.Reader(['en', 'de'], gpu=False)
+
+        # Runs once per process since the reader is cached
+        _warm_up_reader(reader)
         return reader
     except Exception as e:
         st.error(f"Error loading OCR reader: {str(e)}")
         return None
 
 
-def pdf_to_images(pdf_bytes):
-    """Convert PDF pages to images using PyMuPDF"""
+def pdf_page_count(pdf_bytes):
+    """Get the number of pages in a PDF"""
+    pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
     try:
-        images = []
-        # Open PDF from bytes
-        pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-
-        for page_num in range(pdf_document.page_count):
-            # Get page
-            page = pdf_document.load_page(page_num)
+        return pdf_document.page_count
+    finally:
+        pdf_document.close()
 
-            # Convert to image (higher resolution for better OCR)
-            mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better quality
-            pix = page.get_pixmap(matrix=mat)
 
-            # Convert to PIL Image
-            img_data = pix.tobytes("ppm")
-            img = Image.open(io.BytesIO(img_data))
-            images.append(img)
+@njit(cache=True)
+def _contrast_stretch(flat, lo, hi):
+    """Map intensities lo..hi to 0..255 in a single fused pass, clipping values outside.
+
+    Serial on purpose: pages are already rendered in parallel, and a numba thread pool
+    would be started per process and called from several pipeline threads at once.
+    """
+    out = np.empty_like(flat)
+    scale = hi - lo
+    for i in range(flat.shape[0]):
+        v = np.int32(flat[i])
+        if v >= hi:
+            out[i] = 255
+        elif v <= lo:
+            out[i] = 0
+        else:
+            out[i] = (v - lo) * 255 // scale
+    return out
+
+
+def stretch_contrast(arr):
+    """Stretch a page array's contrast so low-contrast scans give fewer false detections"""
+    lo, hi = np.percentile(arr, CONTRAST_PERCENTILES)
+    lo, hi = int(lo), int(hi)
+    # Blank or flat pages have nothing to stretch
+    if hi <= lo:
+        return arr
+    return _contrast_stretch(arr.reshape(-1), lo, hi).reshape(arr.shape)
+
+
+def _render_page(page, grayscale=GRAYSCALE):
+    """Rasterize a PDF page to a grayscale (HxW) or RGB (HxWx3) numpy array"""
+    # Convert to image at the target DPI, capped so large pages don't explode in size
+    zoom = min(RENDER_TARGET_DPI / 72, RENDER_MAX_SIDE_PX / max(page.rect.width, page.rect.height))
+    logger.debug("Rendering page %d at zoom %.2f", page.number + 1, zoom)
+    mat = fitz.Matrix(zoom, zoom)
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    pix = page.get_pixmap(matrix=mat, colorspace=colorspace, alpha=False)
+
+    # View the raw samples directly instead of round-tripping through PPM and PIL
+    arr = np.frombuffer(pix.samples, dtype=np.uint8)
+    if pix.n == 1:
+        arr = arr.reshape(pix.height, pix.width)
+    else:
+        arr = arr.reshape(pix.height, pix.width, pix.n)
+        if pix.n == 4:
+            arr = arr[..., :3].copy()
+
+    if CONTRAST_STRETCH:
+        arr = stretch_contrast(arr)
+    return arr
+
+
+def extract_or_render(page, grayscale=GRAYSCALE):
+    """Use a page's embedded text layer when it has real text, otherwise rasterize it for OCR.
+
+    Returns ("text", text) or ("image", array).
+    """
+    # One paragraph per text block, with the block's line breaks folded into spaces
+    blocks = (block[4] for block in page.get_text("blocks", sort=True) if block[6] == 0)
+    txt = "\n\n".join(" ".join(block.split()) for block in blocks if block.strip())
+    if len(txt) >= TEXT_LAYER_MIN_CHARS and sum(c.isalpha() for c in txt) / len(txt) > TEXT_LAYER_MIN_ALPHA_RATIO:
+        return "text", txt
+    return "image", _render_page(page, grayscale)
+
+
+def _render_pages(pdf_bytes, lo, hi, grayscale=GRAYSCALE):
+    """Extract or rasterize pages lo..hi-1 of a PDF, yielding one (kind, payload) per page"""
+    # Open PDF from bytes
+    pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
 
+    try:
+        for page_num in range(lo, hi):
+            yield extract_or_render(pdf_document.load_page(page_num), grayscale)
+    finally:
         pdf_document.close()
-        return images
 
-    except Exception as e:
-        st.error(f"Error converting PDF to images: {str(e)}")
-        return None
 
+def _to_shared_memory(arr):
+    """Copy an array into a new shared memory block, returning (name, shape, dtype) to reattach it.
 
-def perform_ocr_easyocr(images, reader, lang="en"):
-    """Perform OCR using EasyOCR"""
-    extracted_text = ""
+    The process that reattaches the block also frees it, so the block is left out of this
+    process's resource tracking, which would otherwise keep it listed as leaked.
+    """
+    if sys.version_info >= (3, 13):
+        shm = SharedMemory(create=True, size=max(arr.nbytes, 1), track=False)
+    else:
+        shm = SharedMemory(create=True, size=max(arr.nbytes, 1))
+        resource_tracker.unregister(shm._name, "shared_memory")
+    try:
+        view = np.ndarray(arr.shape, arr.dtype, buffer=shm.buf)
+        view[:] = arr
+        del view
+    finally:
+        shm.close()
+    return shm.name, arr.shape, arr.dtype.str
 
-    progress_bar = st.progress(0)
-    status_text = st.empty()
 
-    for i, image in enumerate(images):
+def _from_shared_memory(name, shape, dtype):
+    """Copy an array out of a shared memory block and free the block"""
+    shm = SharedMemory(name=name)
+    try:
+        view = np.ndarray(shape, dtype, buffer=shm.buf)
+        arr = view.copy()
+        del view
+        return arr
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _release_shared_pages(items):
+    """Free the shared memory blocks of rendered pages that were never pulled"""
+    for kind, payload in items:
+        if kind != "shm":
+            continue
         try:
-            # Update progress
-            progress = (i + 1) / len(images)
-            progress_bar.progress(progress)
+            shm = SharedMemory(name=payload[0])
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+
+
+def _open_worker_pdf(pdf_path):
+    """Open the PDF once per render worker and file"""
+    global _worker_pdf
+    if _worker_pdf is None or _worker_pdf[0] != pdf_path:
+        if _worker_pdf is not None:
+            _worker_pdf[1].close()
+            _worker_pdf = None
+        _worker_pdf = (pdf_path, fitz.open(pdf_path))
+    return _worker_pdf[1]
+
+
+def _shm_has_room(nbytes, writers=1):
+    """Check that /dev/shm can hold nbytes from each of writers processes plus some headroom"""
+    try:
+        return shutil.disk_usage(SHM_DIR).free >= nbytes * writers + SHM_HEADROOM_BYTES
+    except OSError:
+        # No /dev/shm on this platform, so shared memory isn't limited by a small tmpfs
+        return True
+
+
+def _render_range(pdf_path, lo, hi, grayscale=GRAYSCALE):
+    """Render a page range of a PDF file (runs in a worker process).
+
+    Page arrays are handed back through shared memory as ("shm", (name, shape, dtype))
+    instead of being pickled through the result pipe, unless /dev/shm is running out.
+    """
+    pdf_document = _open_worker_pdf(pdf_path)
+
+    pages = []
+    try:
+        for page_num in range(lo, hi):
+            kind, payload = extract_or_render(pdf_document.load_page(page_num), grayscale)
+            # Other workers may be writing pages at the same time
+            if kind == "image" and _shm_has_room(payload.nbytes, RENDER_WORKERS):
+                kind, payload = "shm", _to_shared_memory(payload)
+            pages.append((kind, payload))
+    except BaseException:
+        _release_shared_pages(pages)
+        raise
+    return pages
+
+
+def worker_mp_context():
+    """Start worker processes without fork, which is unsafe from the threaded, OpenMP-using app"""
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
 
-            # Fix: Use simple string formatting instead of get_text for "of"
-            of_text = "von" if lang == 'de' else "of"
-            status_text.text(
-                f"{get_text('processing_page', lang)} {i + 1} {of_text} {len(images)}...")
 
-            # Convert PIL image to numpy array
-            img_array = np.array(image)
+@st.cache_resource
+def get_render_pool():
+    """Create the process pool that rasterizes pages (shared across files and reruns)"""
+    pool = ProcessPoolExecutor(max_workers=RENDER_WORKERS, mp_context=worker_mp_context())
+    # Start the workers now so the first PDF doesn't wait for their interpreters to boot
+    pool.submit(int).result()
+    return pool
+
+
+def pdf_to_pages(pdf_bytes, grayscale=GRAYSCALE, render_pool=None):
+    """Convert PDF pages using PyMuPDF (yields one (kind, payload) per page, in order).
+
+    Pages with a usable text layer come out as ("text", text), all others as
+    ("image", array). With a render_pool, small page ranges are rendered in its
+    worker processes, and new ranges are submitted only as pages are pulled.
+    """
+    page_count = pdf_page_count(pdf_bytes)
+
+    # Small PDFs are not worth the hand-off to the workers
+    if render_pool is None or page_count < PARALLEL_RENDER_MIN_PAGES:
+        yield from _render_pages(pdf_bytes, 0, page_count, grayscale)
+        return
+
+    # Hand the PDF to the workers as a file instead of pickling it once per range
+    fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+    ranges = deque((lo, min(lo + RENDER_RANGE_PAGES, page_count))
+                   for lo in range(0, page_count, RENDER_RANGE_PAGES))
+    in_flight = deque()
+    pending = deque()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf_bytes)
+
+        while ranges or in_flight:
+            while ranges and len(in_flight) < max(1, RENDER_MAX_PAGES_IN_FLIGHT // RENDER_RANGE_PAGES):
+                lo, hi = ranges.popleft()
+                in_flight.append(render_pool.submit(_render_range, pdf_path, lo, hi, grayscale))
+
+            # Collect ranges in submission order to keep pages in order
+            pending.extend(in_flight.popleft().result())
+            while pending:
+                kind, payload = pending.popleft()
+                if kind == "shm":
+                    kind, payload = "image", _from_shared_memory(*payload)
+                yield kind, payload
+    finally:
+        # Free pages rendered for a consumer that stopped early
+        for future in in_flight:
+            future.cancel()
+        for future in in_flight:
+            if not future.cancelled() and future.exception() is None:
+                pending.extend(future.result())
+        _release_shared_pages(pending)
 
-            # Perform OCR
-            results = reader.readtext(img_array, paragraph=True)
+        try:
+            os.unlink(pdf_path)
+        except OSError as e:
+            # Windows can't delete a file a worker still has open
+            logger.warning("Could not remove temporary PDF %s: %s", pdf_path, e)
+
+
+def default_batch_size(reader):
+    """Get the default number of pages per OCR batch for the reader's device"""
+    if reader.device == "cpu":
+        return OCR_BATCH_SIZE_CPU
+    # Other backends can't report free memory, so stay at the CPU size there
+    if not reader.device.startswith("cuda"):
+        return OCR_BATCH_SIZE_CPU
+
+    # Leave a quarter of the free memory to the recognizer
+    free_gb = torch.cuda.mem_get_info()[0] / 2 ** 30
+    return max(1, min(OCR_BATCH_SIZE_GPU, int(free_gb * 0.75 / OCR_GPU_GB_PER_TILE)))
+
+
+def _tile_offsets(size, tile_size, overlap):
+    """Start offsets of tiles covering size pixels, with the last tile flush with the edge"""
+    if size <= tile_size:
+        return [0]
+    step = max(1, int(tile_size * (1 - overlap)))
+    return list(range(0, size - tile_size, step)) + [size - tile_size]
+
+
+def _tile_cores(offsets, tile_size):
+    """Split an axis at the middle of each overlap, giving every tile a (lo, hi) core span"""
+    bounds = [(prev + tile_size + offset) / 2 for prev, offset in zip(offsets, offsets[1:])]
+    return list(zip([float("-inf")] + bounds, bounds + [float("inf")]))
+
+
+def tile(img, th=OCR_TILE_HEIGHT, tw=OCR_TILE_WIDTH, overlap=OCR_TILE_OVERLAP):
+    """Split a page into overlapping th x tw crops, yielding (y, x, core, crop).
+
+    core is the (x0, y0, x1, y1) page region owned by the crop: detections centred there
+    come from this crop only. Pages smaller than a tile are padded with white so every
+    crop has the same shape.
+    """
+    h, w = img.shape[:2]
+    ys = _tile_offsets(h, th, overlap)
+    xs = _tile_offsets(w, tw, overlap)
+    for y, (core_y0, core_y1) in zip(ys, _tile_cores(ys, th)):
+        for x, (core_x0, core_x1) in zip(xs, _tile_cores(xs, tw)):
+            crop = img[y:y + th, x:x + tw]
+            if crop.shape[:2] != (th, tw):
+                padded = np.full((th, tw) + img.shape[2:], 255, dtype=img.dtype)
+                padded[:crop.shape[0], :crop.shape[1]] = crop
+                crop = padded
+            yield y, x, (core_x0, core_y0, core_x1, core_y1), crop
+
+
+def _on_same_line(a, b, min_overlap=OCR_LINE_OVERLAP):
+    """Whether two (x0, y0, x1, y1) boxes overlap vertically by min_overlap of the smaller height"""
+    overlap = min(a[3], b[3]) - max(a[1], b[1])
+    return overlap >= min_overlap * min(a[3] - a[1], b[3] - b[1])
+
+
+def touches_inner_edge(box, x, y, core, th=OCR_TILE_HEIGHT, tw=OCR_TILE_WIDTH, margin=OCR_TILE_EDGE_MARGIN):
+    """Whether a page-coordinate box reaches an edge of the tile at (y, x) that another tile continues past"""
+    return ((core[0] > float("-inf") and box[0] <= x + margin)
+            or (core[2] < float("inf") and box[2] >= x + tw - margin)
+            or (core[1] > float("-inf") and box[1] <= y + margin)
+            or (core[3] < float("inf") and box[3] >= y + th - margin))
+
+
+def resolve_tile_detections(detections):
+    """Pick one reading for text that several overlapping tiles detected.
+
+    detections are (box, text, clipped, in_core) in page coordinates, where clipped boxes
+    touch an inner tile edge and in_core ones are centred in their tile's core. Clipped
+    boxes are merged with every box they overlap on the same line, from any tile, and the
+    merged boxes are returned to be recognized again on the whole page, unless one tile saw
+    all of it uncut. The remaining boxes are kept by their tile core.
+    Returns (kept, seam_boxes), kept as (box, text) pairs.
+    """
+    groups = list(range(len(detections)))
+
+    def find(i):
+        while groups[i] != i:
+            groups[i] = groups[groups[i]]
+            i = groups[i]
+        return i
+
+    for i, (box, _, clipped, _) in enumerate(detections):
+        if not clipped:
+            continue
+        for j, (other, _, _, _) in enumerate(detections):
+            if j != i and box[0] < other[2] and other[0] < box[2] and _on_same_line(box, other):
+                groups[find(j)] = find(i)
+
+    members = {}
+    for i in range(len(detections)):
+        members.setdefault(find(i), []).append(detections[i])
+
+    kept = []
+    seam_boxes = []
+    for group in members.values():
+        if any(clipped for _, _, clipped, _ in group):
+            boxes = [box for box, _, _, _ in group]
+            merged = (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                      max(b[2] for b in boxes), max(b[3] for b in boxes))
+            whole = [(box, text) for box, text, clipped, _ in group
+                     if not clipped and all(abs(a - b) <= OCR_TILE_EDGE_MARGIN for a, b in zip(box, merged))]
+            if whole:
+                kept.append(whole[0])
+            else:
+                seam_boxes.append(merged)
+        else:
+            kept.extend((box, text) for box, text, _, in_core in group if in_core)
+    return kept, seam_boxes
+
+
+def group_lines(detections, min_overlap=OCR_LINE_OVERLAP, column_gap=OCR_COLUMN_GAP):
+    """Group (box, text) detections into lines, each ordered left to right.
+
+    Boxes join a line when they overlap it vertically by at least min_overlap of the smaller
+    height and are at most column_gap box heights away from it, so side-by-side columns
+    give separate lines. Returns (x0, y0, x1, y1, texts) per line, top to bottom.
+    """
+    lines = []
+    for box, text in sorted(detections, key=lambda d: ((d[0][1] + d[0][3]) / 2, d[0][0])):
+        for idx in range(len(lines) - 1, -1, -1):
+            x0, y0, x1, y1, items = lines[idx]
+            gap = max(box[0] - x1, x0 - box[2])
+            if _on_same_line((x0, y0, x1, y1), box, min_overlap) and gap <= column_gap * (box[3] - box[1]):
+                items.append((box[0], text))
+                lines[idx] = (min(x0, box[0]), min(y0, box[1]), max(x1, box[2]), max(y1, box[3]), items)
+                break
+        else:
+            lines.append((box[0], box[1], box[2], box[3], [(box[0], text)]))
+
+    lines.sort(key=lambda line: (line[1], line[0]))
+    return [(x0, y0, x1, y1, [text for _, text in sorted(items, key=lambda item: item[0])])
+            for x0, y0, x1, y1, items in lines]
+
+
+def lines_to_text(lines, paragraph_gap=OCR_PARAGRAPH_GAP):
+    """Join grouped lines into page text, one paragraph per run of lines stacked closely below each other.
+
+    A line continues the paragraph right above it when they overlap horizontally, so columns
+    are read a paragraph at a time instead of line by line across the page.
+    """
+    if not lines:
+        return ""
+
+    line_height = float(np.median([y1 - y0 for _, y0, _, y1, _ in lines]))
+    # Each paragraph is [x0, x1, last_y0, last_y1, texts]
+    paragraphs = []
+    for x0, y0, x1, y1, texts in lines:
+        for paragraph in reversed(paragraphs):
+            px0, px1, last_y0, last_y1, _ = paragraph
+            if px0 < x1 and x0 < px1 and y0 > last_y0 and y0 - last_y1 <= paragraph_gap * line_height:
+                paragraph[:4] = [min(px0, x0), max(px1, x1), y0, y1]
+                paragraph[4].append(" ".join(texts))
+                break
+        else:
+            paragraphs.append([x0, x1, y0, y1, [" ".join(texts)]])
+
+    return "\n\n".join(" ".join(paragraph[4]) for paragraph in paragraphs)
+
+
+def default_recognizer_batch_size(reader):
+    """Pick the EasyOCR recognizer batch size (text boxes per forward pass) from free GPU memory"""
+    # On CPU larger recognizer batches only thrash the caches
+    if not reader.device.startswith("cuda"):
+        return 1
+
+    free_gb = torch.cuda.mem_get_info()[0] / 2 ** 30
+    if free_gb > 8:
+        return 32
+    if free_gb > 4:
+        return 8
+    if free_gb > 2:
+        return 4
+    return 1
+
+
+def perform_ocr_easyocr(images, reader, rec_batch_size=None, batch_size=None):
+    """Perform OCR on a batch of page arrays with EasyOCR, returning one text per page"""
+    if rec_batch_size is None:
+        rec_batch_size = default_recognizer_batch_size(reader)
+    if batch_size is None:
+        batch_size = default_batch_size(reader)
+
+    # Tile every page so all detector inputs share one shape, whatever the page size
+    tiles = [(page_idx, y, x, core, crop) for page_idx, image in enumerate(images)
+             for y, x, core, crop in tile(image)]
+    detections = [[] for _ in images]
+
+    start = 0
+    while start < len(tiles):
+        chunk = tiles[start:start + batch_size]
+
+        # Pages are not staged in pinned memory: EasyOCR resizes and normalizes every
+        # image into new pageable arrays before its own host-to-device copy, so pinning
+        # our input buffers would not reach that copy.
+        try:
+            results_batch = reader.readtext_batched(
+                [crop for _, _, _, _, crop in chunk],
+                n_width=OCR_TILE_WIDTH,
+                n_height=OCR_TILE_HEIGHT,
+                paragraph=False,
+                batch_size=rec_batch_size
+            )
+        except torch.cuda.OutOfMemoryError:
+            if batch_size == 1:
+                raise
+            # Free memory was overestimated; retry the rest at half the batch size
+            torch.cuda.empty_cache()
+            batch_size //= 2
+            logger.warning("CUDA out of memory on %d tiles, retrying with %d", len(chunk), batch_size)
+            continue
+        start += len(chunk)
 
-            # Extract text from results
-            page_text = ""
+        for (page_idx, y, x, core, _), results in zip(chunk, results_batch):
+            # detection[0] is the bbox (4 points in tile coordinates), detection[1] is text
             for detection in results:
-                text = detection[1]  # detection[0] is bbox, detection[1] is text, detection[2] is confidence
-                page_text += text + " "
+                xs = [point[0] + x for point in detection[0]]
+                ys = [point[1] + y for point in detection[0]]
+                box = (min(xs), min(ys), max(xs), max(ys))
+
+                # Boxes in the overlaps are kept once, by the tile whose core holds their centre;
+                # boxes a tile edge may have cut off are resolved across tiles below
+                cx, cy = (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+                in_core = core[0] <= cx < core[2] and core[1] <= cy < core[3]
+                detections[page_idx].append((box, detection[1], touches_inner_edge(box, x, y, core), in_core))
+
+    page_texts = []
+    for image, page_detections in zip(images, detections):
+        kept, seam_boxes = resolve_tile_detections(page_detections)
+
+        # Read text cut by a tile seam again from the whole page, once per merged box
+        if seam_boxes:
+            # recognize converts grayscale and RGB pages itself
+            for detection in reader.recognize(
+                    image,
+                    horizontal_list=[[int(x0), int(x1), int(y0), int(y1)] for x0, y0, x1, y1 in seam_boxes],
+                    free_list=[],
+                    batch_size=rec_batch_size,
+                    paragraph=False):
+                xs = [point[0] for point in detection[0]]
+                ys = [point[1] for point in detection[0]]
+                kept.append(((min(xs), min(ys), max(xs), max(ys)), detection[1]))
+
+        # Paragraphs are built once per page from the merged line boxes
+        page_texts.append(lines_to_text(group_lines(kept)).strip())
+
+    return page_texts
+
+
+def _queue_put(q, item, cancel):
+    """Put an item on a bounded pipeline queue, giving up once the pipeline is cancelled"""
+    while not cancel.is_set():
+        try:
+            q.put(item, timeout=PIPELINE_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
 
-            extracted_text += f"\n--- {get_text('page_separator', lang)} {i + 1} ---\n"
-            extracted_text += page_text.strip()
-            extracted_text += "\n\n"
 
-        except Exception as e:
-            st.warning(f"Error performing OCR on page {i + 1}: {str(e)}")
+def _queue_get(q, cancel, deadline=None):
+    """Get an item from a pipeline queue, raising queue.Empty once the deadline has passed"""
+    while not cancel.is_set():
+        timeout = PIPELINE_POLL_INTERVAL
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                raise queue.Empty
+        try:
+            return q.get(timeout=timeout)
+        except queue.Empty:
             continue
+    return _PIPELINE_DONE
 
-    progress_bar.empty()
-    status_text.empty()
 
-    return extracted_text
+def render_worker(pdf_bytes, render_q, cancel, grayscale=GRAYSCALE, render_pool=None):
+    """Pipeline stage 1: extract or rasterize PDF pages onto the render queue"""
+    try:
+        for page_idx, (kind, payload) in enumerate(pdf_to_pages(pdf_bytes, grayscale, render_pool)):
+            if not _queue_put(render_q, (page_idx, kind, payload), cancel):
+                return
+    finally:
+        _queue_put(render_q, _PIPELINE_DONE, cancel)
+
+
+def ocr_worker(reader, render_q, ocr_q, batch_size, cancel, rec_batch_size=None):
+    """Pipeline stage 2: collect rendered pages into batches and OCR them, passing text pages through"""
+    try:
+        done = False
+        while not done:
+            # Block for the first page, then wait at most OCR_BATCH_TIMEOUT to fill the batch
+            batch = []
+            text_page = None
+            deadline = None
+            while len(batch) < batch_size:
+                try:
+                    item = _queue_get(render_q, cancel, deadline)
+                except queue.Empty:
+                    break
+                if item is _PIPELINE_DONE:
+                    done = True
+                    break
+
+                page_idx, kind, payload = item
+                if kind == "text":
+                    # Emit it after the pending batch to keep pages in order
+                    text_page = (page_idx, payload, None)
+                    break
+
+                batch.append((page_idx, payload))
+                if deadline is None:
+                    deadline = time.monotonic() + OCR_BATCH_TIMEOUT
+
+            results = []
+            if batch:
+                page_indices = [page_idx for page_idx, _ in batch]
+                try:
+                    page_texts = perform_ocr_easyocr(
+                        [image for _, image in batch], reader, rec_batch_size, batch_size)
+                    results = [(page_idx, page_text, None) for page_idx, page_text in zip(page_indices, page_texts)]
+                except Exception as e:
+                    results = [(page_idx, None, e) for page_idx in page_indices]
+
+            if text_page is not None:
+                results.append(text_page)
+
+            for result in results:
+                if not _queue_put(ocr_q, result, cancel):
+                    return
+    finally:
+        _queue_put(ocr_q, _PIPELINE_DONE, cancel)
+
+
+def add_page_to_docx(doc, page_num, page_text, lang="en"):
+    """Append one page of extracted text to a DOCX document"""
+    doc.add_heading(f"--- {get_text('page_separator', lang)} {page_num} ---", level=1)
+    # Text layers and OCR results can both hold several paragraphs
+    for paragraph in page_text.split('\n\n'):
+        if paragraph.strip():
+            doc.add_paragraph(paragraph.strip())
+
+
+def run_ocr_pipeline(pdf_bytes, filename, reader, lang="en", grayscale=GRAYSCALE, batch_size=None,
+                     rec_batch_size=None, render_pool=None, on_page=None):
+    """Rasterize, OCR and write a PDF to DOCX with the three stages running concurrently.
+
+    Rendering and OCR run on worker threads connected by bounded queues, while the
+    calling thread drains OCR results into the document. on_page(page_idx, page_count, error)
+    is called from the calling thread after each page. Returns (page_texts, doc, failed_pages),
+    where page_texts holds one text per page and None for pages that failed.
+    """
+    if batch_size is None:
+        batch_size = default_batch_size(reader)
+    if rec_batch_size is None:
+        rec_batch_size = default_recognizer_batch_size(reader)
+
+    page_count = pdf_page_count(pdf_bytes)
+
+    render_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    ocr_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    cancel = threading.Event()
+
+    page_texts = [None] * page_count
+    failed_pages = []
+    doc = Document()
+    doc.add_heading(f'OCR Result: {filename}', 0)
+
+    # EasyOCR releases the GIL inside torch, so threads are enough to overlap the stages
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        render_future = executor.submit(render_worker, pdf_bytes, render_q, cancel, grayscale, render_pool)
+        ocr_future = executor.submit(ocr_worker, reader, render_q, ocr_q, batch_size, cancel, rec_batch_size)
+
+        try:
+            # Pipeline stage 3: write pages to the document as they come out of OCR
+            while (item := ocr_q.get()) is not _PIPELINE_DONE:
+                page_idx, page_text, error = item
+                if error is None:
+                    page_texts[page_idx] = page_text
+                    add_page_to_docx(doc, page_idx + 1, page_text, lang)
+                else:
+                    failed_pages.append(page_idx)
+
+                if on_page is not None:
+                    on_page(page_idx, page_count, error)
+        finally:
+            cancel.set()
+
+        # Re-raise errors from the worker threads
+        render_future.result()
+        ocr_future.result()
+
+    return page_texts, doc, failed_pages
+
+
+def format_extracted_text(page_texts, lang="en"):
+    """Join page texts under page separators (pages that failed OCR are None and left out)"""
+    return "".join(
+        f"\n--- {get_text('page_separator', lang)} {page_idx + 1} ---\n{page_text}\n\n"
+        for page_idx, page_text in enumerate(page_texts) if page_text is not None)
 
 
-def create_docx(text, filename, lang="en"):
-    """Create a DOCX document from extracted text"""
+def ocr_pdf_with_progress(pdf_bytes, filename, reader, lang="en", grayscale=GRAYSCALE, rec_batch_size=None,
+                          render_pool=None):
+    """Run the OCR pipeline on a PDF while showing page progress"""
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    # Fix: Use simple string formatting instead of get_text for "of"
+    of_text = "von" if lang == 'de' else "of"
+
+    def on_page(page_idx, page_count, error):
+        # Update progress
+        progress_bar.progress((page_idx + 1) / page_count)
+        status_text.text(
+            f"{get_text('processing_page', lang)} {page_idx + 1} {of_text} {page_count}...")
+
+        if error is not None:
+            st.warning(f"Error performing OCR on page {page_idx + 1}: {str(error)}")
+
+    try:
+        return run_ocr_pipeline(pdf_bytes, filename, reader, lang, grayscale, rec_batch_size=rec_batch_size,
+                                render_pool=render_pool, on_page=on_page)
+    finally:
+        progress_bar.empty()
+        status_text.empty()
+
+
+def ocr_cache_key(pdf_bytes, grayscale=GRAYSCALE):
+    """Build the OCR cache key for a PDF and the settings that affect its text"""
+    digest = hashlib.sha1(pdf_bytes).hexdigest()
+    # The render mode changes results
+    return f"{digest}_{'gray' if grayscale else 'color'}"
+
+
+def load_cached_pages(cache_key):
+    """Get cached per-page OCR texts, or None if the PDF hasn't been processed before"""
+    try:
+        return json.loads((OCR_CACHE_DIR / f"{cache_key}.json").read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def store_cached_pages(cache_key, page_texts):
+    """Write per-page OCR texts to the cache atomically so readers never see a partial file"""
+    OCR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=OCR_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(page_texts, f, ensure_ascii=False)
+        os.replace(tmp_path, OCR_CACHE_DIR / f"{cache_key}.json")
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def clear_ocr_cache():
+    """Remove all cached OCR results"""
+    shutil.rmtree(OCR_CACHE_DIR, ignore_errors=True)
+
+
+def _get_worker_reader():
+    """Load the EasyOCR reader of a file worker process once (readers can't be pickled)"""
+    global _worker_reader
+    if _worker_reader is None:
+        _worker_reader = easyocr.Reader(['en', 'de'], gpu=False)
+    return _worker_reader
+
+
+def _process_file_worker(pdf_bytes, filename, lang="en", grayscale=GRAYSCALE, rec_batch_size=None,
+                         temp_dir=None, cpu_threads=1):
+    """OCR one PDF into a temporary DOCX file (runs in a file worker process).
+
+    Returns (page_texts, doc_path, failed_pages); doc_path is None when no text was found.
+    """
+    # Share the cores with the other busy workers instead of oversubscribing them
+    torch.set_num_threads(cpu_threads)
+
+    page_texts, doc, failed_pages = run_ocr_pipeline(
+        pdf_bytes, filename, _get_worker_reader(), lang, grayscale, rec_batch_size=rec_batch_size)
+
+    doc_path = save_docx_to_temp(doc, temp_dir) if format_extracted_text(page_texts, lang).strip() else None
+    return page_texts, doc_path, failed_pages
+
+
+@st.cache_resource
+def available_memory_gb():
+    """Memory still available to this process (GB), within its cgroup limit; None if unknown"""
+    try:
+        with open("/proc/meminfo") as f:
+            available = next(int(line.split()[1]) * 1024 for line in f if line.startswith("MemAvailable:"))
+    except (OSError, StopIteration, ValueError):
+        return None
+
+    # Containers (e.g. Streamlit Cloud) see the host's memory in /proc/meminfo
+    try:
+        limit = Path("/sys/fs/cgroup/memory.max").read_text().strip()
+        if limit != "max":
+            used = int(Path("/sys/fs/cgroup/memory.current").read_text())
+            available = min(available, int(limit) - used)
+    except (OSError, ValueError):
+        pass
+    return available / 2 ** 30
+
+
+@st.cache_resource
+def get_file_executor():
+    """Create the process pool that OCRs uploaded files concurrently on CPU (shared across reruns).
+
+    Returns (executor, workers); executor is None when there isn't memory for a single worker.
+    """
+    workers = FILE_WORKERS
+    memory_gb = available_memory_gb()
+    if memory_gb is not None:
+        # Measured before any worker exists, so it only counts the app itself
+        workers = min(workers, int(memory_gb // FILE_WORKER_MEMORY_GB))
+    if workers < 1:
+        return None, 0
+    return ProcessPoolExecutor(max_workers=workers, mp_context=worker_mp_context()), workers
+
+
+def create_docx(page_texts, filename, lang="en"):
+    """Create a DOCX document from per-page texts, laid out like the OCR pipeline's"""
     try:
         doc = Document()
 
         # Add title
-        title = doc.add_heading(f'OCR Result: {filename}', 0)
+        doc.add_heading(f'OCR Result: {filename}', 0)
 
-        # Add the extracted text
-        # Split text into paragraphs for better formatting
-        paragraphs = text.split('\n\n')
-
-        for paragraph in paragraphs:
-            if paragraph.strip():
-                # Handle page separators
-                if paragraph.strip().startswith(f'--- {get_text("page_separator", lang)}'):
-                    doc.add_heading(paragraph.strip(), level=1)
-                else:
-                    doc.add_paragraph(paragraph.strip())
+        # Add the extracted text page by page
+        for page_idx, page_text in enumerate(page_texts):
+            if page_text is not None:
+                add_page_to_docx(doc, page_idx + 1, page_text, lang)
 
         return doc
     except Exception as e:
@@ -257,38 +1085,25 @@ def create_download_link(doc, filename, lang="en"):
         return False
 
 
-def process_single_pdf(uploaded_file, reader, lang="en"):
+def process_single_pdf(uploaded_file, reader, lang="en", grayscale=GRAYSCALE):
     """Process a single PDF file"""
     try:
         # Get PDF bytes
         pdf_bytes = uploaded_file.getvalue()
 
-        # Convert PDF to images
-        with st.spinner(get_text("converting_pdf", lang)):
-            images = pdf_to_images(pdf_bytes)
-
-        if images is None:
-            return False
-
-        st.success(f"✅ {len(images)} {get_text('pages_converted', lang)}")
-
-        # Perform OCR
+        # Render, OCR and create DOCX in one pipeline
+        original_name = Path(uploaded_file.name).stem
+        docx_filename = f"{original_name}_OCR.docx"
         with st.spinner(get_text("performing_ocr", lang)):
-            extracted_text = perform_ocr_easyocr(images, reader, lang)
+            page_texts, doc, _ = ocr_pdf_with_progress(pdf_bytes, original_name, reader, lang, grayscale)
+        extracted_text = format_extracted_text(page_texts, lang)
+
+        st.success(f"✅ {pdf_page_count(pdf_bytes)} {get_text('pages_converted', lang)}")
 
         if not extracted_text.strip():
             st.warning(get_text("no_text_extracted", lang))
             return False
 
-        # Create DOCX
-        with st.spinner(get_text("creating_docx", lang)):
-            original_name = Path(uploaded_file.name).stem
-            docx_filename = f"{original_name}_OCR.docx"
-            doc = create_docx(extracted_text, original_name, lang)
-
-        if doc is None:
-            return False
-
         # Create download link
         create_download_link(doc, docx_filename, lang)
 
@@ -298,7 +1113,7 @@ def process_single_pdf(uploaded_file, reader, lang="en"):
                 get_text("extracted_text_label", lang),
                 extracted_text[:2000] + ("..." if len(extracted_text) > 2000 else ""),
                 height=200,
-                key=f"preview_{uploaded_file.name}_{hash(extracted_text[:100])}"
+                key=f"preview_{docx_filename}_{preview_digest(extracted_text)}"
             )
 
         return True
@@ -308,21 +1123,23 @@ def process_single_pdf(uploaded_file, reader, lang="en"):
         return False
 
 
+def build_zip(processed_files):
+    """Pack DOCX files into a ZIP archive and return its bytes"""
+    zip_buffer = io.BytesIO()
+    # DOCX files are already deflate-compressed, so store them as-is
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+        for filename, doc_path in processed_files.items():
+            zip_file.write(doc_path, arcname=filename)
+    return zip_buffer.getvalue()
+
+
 def create_zip_download(processed_files, lang="en"):
     """Create a ZIP file containing all DOCX files for download"""
     try:
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for filename, doc_bytes in processed_files.items():
-                zip_file.writestr(filename, doc_bytes)
-
-        zip_buffer.seek(0)
-
-        # Create download button for ZIP
+        # Create download button for ZIP; the archive is only built when it is clicked
         st.download_button(
             label=f"📦 Download All Files ({len(processed_files)} files)",
-            data=zip_buffer.getvalue(),
+            data=functools.partial(build_zip, processed_files),
             file_name="ocr_results.zip",
             mime="application/zip",
             key="download_all_zip"
@@ -334,67 +1151,239 @@ def create_zip_download(processed_files, lang="en"):
         return False
 
 
-def process_single_pdf_with_state(uploaded_file, reader, lang="en"):
-    """Process a single PDF file and store result in session state"""
-    try:
-        # Get PDF bytes
-        pdf_bytes = uploaded_file.getvalue()
+@st.cache_resource
+def get_results_root():
+    """Create the directory holding all sessions' DOCX files, removed when the server exits"""
+    results_root = tempfile.mkdtemp(prefix="ocr_results_")
+    atexit.register(shutil.rmtree, results_root, ignore_errors=True)
+    return results_root
 
-        # Convert PDF to images
-        with st.spinner(get_text("converting_pdf", lang)):
-            images = pdf_to_images(pdf_bytes)
 
-        if images is None:
-            return False
+def get_session_temp_dir():
+    """Get this session's directory for DOCX files"""
+    if 'temp_dir' not in st.session_state or not os.path.isdir(st.session_state.temp_dir):
+        st.session_state.temp_dir = tempfile.mkdtemp(dir=get_results_root())
+    return st.session_state.temp_dir
 
-        st.success(f"✅ {len(images)} {get_text('pages_converted', lang)}")
 
-        # Perform OCR
-        with st.spinner(get_text("performing_ocr", lang)):
-            extracted_text = perform_ocr_easyocr(images, reader, lang)
+def save_docx_to_temp(doc, temp_dir=None):
+    """Save a DOCX document to a temporary file in temp_dir and return its path"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".docx", dir=temp_dir) as tmp_file:
+        doc.save(tmp_file)
+    return tmp_file.name
 
-        if not extracted_text.strip():
-            st.warning(get_text("no_text_extracted", lang))
-            return False
 
-        # Create DOCX
+def remove_processed_files(processed_files):
+    """Delete the temporary DOCX files behind processed results"""
+    for data in processed_files.values():
+        try:
+            os.unlink(data['doc_path'])
+        except FileNotFoundError:
+            pass
+
+
+def finish_pdf_with_state(uploaded_file, page_texts, doc_path, lang="en", temp_dir=None):
+    """Store a processed PDF's result in session state and show its preview"""
+    original_name = Path(uploaded_file.name).stem
+    docx_filename = f"{original_name}_OCR.docx"
+    extracted_text = format_extracted_text(page_texts, lang)
+
+    if not extracted_text.strip():
+        st.warning(get_text("no_text_extracted", lang))
+        return False
+
+    if doc_path is None:
+        # Cached pages: only the DOCX has to be rebuilt
         with st.spinner(get_text("creating_docx", lang)):
-            original_name = Path(uploaded_file.name).stem
-            docx_filename = f"{original_name}_OCR.docx"
-            doc = create_docx(extracted_text, original_name, lang)
+            doc = create_docx(page_texts, original_name, lang)
 
         if doc is None:
             return False
 
-        # Save document to bytes and store in session state
-        doc_io = io.BytesIO()
-        doc.save(doc_io)
-        doc_bytes = doc_io.getvalue()
+        # Save document to disk and store its path in session state
+        doc_path = save_docx_to_temp(doc, temp_dir)
 
-        # Store in session state
-        if 'processed_files' not in st.session_state:
-            st.session_state.processed_files = {}
+    # Store in session state
+    if 'processed_files' not in st.session_state:
+        st.session_state.processed_files = {}
 
-        st.session_state.processed_files[docx_filename] = {
-            'doc_bytes': doc_bytes,
-            'extracted_text': extracted_text,
-            'original_name': uploaded_file.name
-        }
+    # Drop the file of an earlier run of the same PDF
+    if docx_filename in st.session_state.processed_files:
+        remove_processed_files({docx_filename: st.session_state.processed_files[docx_filename]})
 
-        # Show preview of extracted text
-        with st.expander(f"{get_text('preview_text', lang)} {uploaded_file.name}"):
-            st.text_area(
-                get_text("extracted_text_label", lang),
-                extracted_text[:2000] + ("..." if len(extracted_text) > 2000 else ""),
-                height=200,
-                key=f"preview_{uploaded_file.name}_{hash(extracted_text[:100])}"
-            )
+    record = {
+        'doc_path': doc_path,
+        'extracted_text': extracted_text,
+        'original_name': uploaded_file.name,
+        'digest': preview_digest(extracted_text)
+    }
+    st.session_state.processed_files[docx_filename] = record
+
+    # Show preview of extracted text
+    with st.expander(f"{get_text('preview_text', lang)} {record['original_name']}"):
+        st.text_area(
+            get_text("extracted_text_label", lang),
+            record['extracted_text'][:2000] + ("..." if len(record['extracted_text']) > 2000 else ""),
+            height=200,
+            key=f"preview_{docx_filename}_{record['digest']}"
+        )
 
-        return True
+    return True
 
-    except Exception as e:
-        st.error(f"Error processing {uploaded_file.name}: {str(e)}")
-        return False
+
+def preview_digest(extracted_text):
+    """Stable short digest of extracted text for widget keys (unlike the salted built-in hash)"""
+    return hashlib.blake2b(extracted_text[:1024].encode('utf-8'), digest_size=8).hexdigest()
+
+
+def report_pdf_result(uploaded_file, success, lang="en"):
+    """Show the outcome of processing one PDF"""
+    if success:
+        st.success(f"✅ {uploaded_file.name} {get_text('successfully_processed', lang)}")
+    else:
+        st.error(f"❌ {get_text('failed_to_process', lang)} {uploaded_file.name}")
+    st.divider()
+
+
+def store_ocr_result(uploaded_file, cache_key, page_texts, doc_path, failed_pages, lang="en"):
+    """Cache a complete OCR result and store it in session state"""
+    if not failed_pages and doc_path is not None:
+        try:
+            store_cached_pages(cache_key, page_texts)
+        except OSError as e:
+            st.warning(f"Error caching OCR result: {str(e)}")
+
+    return finish_pdf_with_state(uploaded_file, page_texts, doc_path, lang)
+
+
+def process_pdfs_with_state(uploaded_files, reader, lang="en", grayscale=GRAYSCALE, rec_batch_size=None):
+    """Process PDF files and store results in session state.
+
+    Files OCRed by the app itself show page progress; on CPU, all files after the first
+    are OCRed concurrently in file worker processes. Returns the number of files processed successfully.
+    """
+    total_files = len(uploaded_files)
+    success_count = 0
+    done_count = 0
+    temp_dir = get_session_temp_dir()
+
+    progress_bar = st.progress(0)
+
+    def file_done(uploaded_file, success):
+        nonlocal success_count
+        if success:
+            success_count += 1
+        report_pdf_result(uploaded_file, success, lang)
+        progress_bar.progress(done_count / total_files)
+
+    uncached = []
+    for uploaded_file in uploaded_files:
+        try:
+            # Get PDF bytes
+            pdf_bytes = uploaded_file.getvalue()
+            cache_key = ocr_cache_key(pdf_bytes, grayscale)
+            page_texts = load_cached_pages(cache_key)
+
+            if page_texts is None:
+                uncached.append((uploaded_file, pdf_bytes, cache_key))
+                continue
+
+            # Same PDF was processed before, skip rendering and OCR
+            done_count += 1
+            st.subheader(f"{get_text('processing_file', lang)} {done_count}/{total_files}: {uploaded_file.name}")
+            st.info(get_text("cache_hit", lang))
+            success = finish_pdf_with_state(uploaded_file, page_texts, None, lang, temp_dir)
+
+        except Exception as e:
+            done_count += 1
+            st.error(f"Error processing {uploaded_file.name}: {str(e)}")
+            success = False
+
+        file_done(uploaded_file, success)
+
+    # GPU readers share one CUDA context, so files run one at a time on the loaded reader.
+    # On CPU the app OCRs the first file itself while file workers take the rest, if memory allows.
+    executor, workers = get_file_executor() if reader.device == "cpu" and len(uncached) > 1 else (None, 0)
+    if executor is None:
+        in_process, pooled = uncached, []
+    else:
+        in_process, pooled = uncached[:1], uncached[1:]
+
+    futures = {}
+    cpu_threads = None
+    if pooled:
+        # Split the cores between the app and the busy file workers
+        cpu_threads = max(1, (os.cpu_count() or 1) // (min(workers, len(pooled)) + 1))
+
+        for uploaded_file, pdf_bytes, cache_key in pooled:
+            try:
+                future = executor.submit(
+                    _process_file_worker, pdf_bytes, Path(uploaded_file.name).stem, lang, grayscale,
+                    rec_batch_size, temp_dir, cpu_threads)
+                futures[future] = (uploaded_file, cache_key)
+            except Exception as e:
+                done_count += 1
+                st.error(f"Error processing {uploaded_file.name}: {str(e)}")
+                file_done(uploaded_file, False)
+
+    # A file OCRed alone gets the render pool; next to file workers the cores are already busy
+    render_pool = get_render_pool() if in_process and not futures else None
+    app_threads = torch.get_num_threads()
+    try:
+        if cpu_threads is not None:
+            torch.set_num_threads(cpu_threads)
+
+        for uploaded_file, pdf_bytes, cache_key in in_process:
+            done_count += 1
+            st.subheader(f"{get_text('processing_file', lang)} {done_count}/{total_files}: {uploaded_file.name}")
+
+            try:
+                with st.spinner(get_text("performing_ocr", lang)):
+                    page_texts, doc, failed_pages = ocr_pdf_with_progress(
+                        pdf_bytes, Path(uploaded_file.name).stem, reader, lang, grayscale,
+                        rec_batch_size, render_pool)
+
+                doc_path = save_docx_to_temp(doc, temp_dir) if format_extracted_text(page_texts, lang).strip() else None
+                success = store_ocr_result(uploaded_file, cache_key, page_texts, doc_path, failed_pages, lang)
+
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    # A render worker died (e.g. out of memory); start a fresh pool next time
+                    get_render_pool.clear()
+                st.error(f"Error processing {uploaded_file.name}: {str(e)}")
+                success = False
+
+            file_done(uploaded_file, success)
+    finally:
+        torch.set_num_threads(app_threads)
+
+    with st.spinner(get_text("performing_ocr", lang)):
+        for future in as_completed(futures):
+            uploaded_file, cache_key = futures[future]
+            done_count += 1
+            st.subheader(f"{get_text('processing_file', lang)} {done_count}/{total_files}: {uploaded_file.name}")
+
+            try:
+                page_texts, doc_path, failed_pages = future.result()
+
+                if failed_pages:
+                    pages = ", ".join(str(page_idx + 1) for page_idx in failed_pages)
+                    st.warning(f"Error performing OCR on page(s) {pages}")
+
+                success = store_ocr_result(uploaded_file, cache_key, page_texts, doc_path, failed_pages, lang)
+
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    # A worker died (e.g. out of memory); start a fresh pool next time
+                    get_file_executor.clear()
+                st.error(f"Error processing {uploaded_file.name}: {str(e)}")
+                success = False
+
+            file_done(uploaded_file, success)
+
+    progress_bar.empty()
+
+    return success_count
 
 
 def main():
@@ -415,13 +1404,43 @@ def main():
             index=0
         )
 
+        gpu_available = _pick_device() != "cpu"
+        use_gpu = st.checkbox(
+            get_text("use_gpu_label", lang),
+            value=gpu_available,
+            disabled=not gpu_available,
+            help=get_text("use_gpu_help", lang) if gpu_available else get_text("gpu_unavailable", lang),
+            key="use_gpu"
+        )
+
+        color_mode = st.checkbox(
+            get_text("color_mode_label", lang),
+            value=not GRAYSCALE,
+            help=get_text("color_mode_help", lang),
+            key="color_mode"
+        )
+
+        if st.button(get_text("clear_cache", lang)):
+            clear_ocr_cache()
+            st.success(get_text("cache_cleared", lang))
+
+        with st.expander(get_text("advanced_settings", lang)):
+            rec_batch_size = st.number_input(
+                get_text("rec_batch_size_label", lang),
+                min_value=0,
+                max_value=256,
+                value=0,
+                help=get_text("rec_batch_size_help", lang),
+                key="rec_batch_size"
+            )
+
     # Header
     st.title(get_text("title", lang))
     st.markdown(get_text("description", lang))
 
     # Load OCR reader
     with st.spinner(get_text("loading_model", lang)):
-        reader = load_ocr_reader()
+        reader = load_ocr_reader(use_gpu)
 
     if reader is None:
         st.error(get_text("model_load_error", lang))
@@ -447,25 +1466,17 @@ def main():
         # Clear previous results button
         if st.session_state.processed_files:
             if st.button("🗑️ Clear Previous Results"):
+                remove_processed_files(st.session_state.processed_files)
                 st.session_state.processed_files = {}
                 st.rerun()
 
         # Process button
         if st.button(get_text("start_processing", lang), type="primary"):
-            success_count = 0
             total_files = len(uploaded_files)
 
-            # Process each file
-            for i, uploaded_file in enumerate(uploaded_files):
-                st.subheader(f"{get_text('processing_file', lang)} {i + 1}/{total_files}: {uploaded_file.name}")
-
-                if process_single_pdf_with_state(uploaded_file, reader, lang):
-                    success_count += 1
-                    st.success(f"✅ {uploaded_file.name} {get_text('successfully_processed', lang)}")
-                else:
-                    st.error(f"❌ {get_text('failed_to_process', lang)} {uploaded_file.name}")
-
-                st.divider()
+            # Process all files concurrently
+            success_count = process_pdfs_with_state(
+                uploaded_files, reader, lang, not color_mode, rec_batch_size or None)
 
             # Summary
             if success_count > 0:
@@ -480,21 +1491,28 @@ def main():
         st.markdown("---")
         st.subheader("📥 Download Results")
 
+        # Skip results whose temporary file has gone missing instead of failing all downloads
+        available_files = {}
+        for filename, data in st.session_state.processed_files.items():
+            if os.path.isfile(data['doc_path']):
+                available_files[filename] = data['doc_path']
+            else:
+                st.warning(f"⚠️ {filename} is no longer available, please process it again")
+
         # Download all as ZIP
-        if len(st.session_state.processed_files) > 1:
-            files_for_zip = {filename: data['doc_bytes'] for filename, data in st.session_state.processed_files.items()}
-            create_zip_download(files_for_zip, lang)
+        if len(available_files) > 1:
+            create_zip_download(available_files, lang)
             st.markdown("**Or download individual files:**")
 
         # Individual download buttons
-        cols = st.columns(min(3, len(st.session_state.processed_files)))
+        cols = st.columns(min(3, max(1, len(available_files))))
 
-        for idx, (filename, data) in enumerate(st.session_state.processed_files.items()):
+        for idx, (filename, doc_path) in enumerate(available_files.items()):
             col = cols[idx % len(cols)]
             with col:
                 st.download_button(
                     label=f"📥 {filename}",
-                    data=data['doc_bytes'],
+                    data=Path(doc_path).read_bytes,
                     file_name=filename,
                     mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                     key=f"download_individual_{filename}"
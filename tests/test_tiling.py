@@ -0,0 +1,137 @@
+import numpy as np
+
+from main import (
+    _tile_cores,
+    _tile_offsets,
+    group_lines,
+    lines_to_text,
+    resolve_tile_detections,
+    tile,
+    touches_inner_edge,
+)
+
+INF = float("inf")
+
+
+def detect_in_tiles(img, line_box, text="text"):
+    """Simulate the detector: each tile reports the part of line_box it sees"""
+    detections = []
+    for y, x, core, crop in tile(img):
+        th, tw = crop.shape[:2]
+        box = (max(line_box[0], x), max(line_box[1], y), min(line_box[2], x + tw), min(line_box[3], y + th))
+        if box[0] >= box[2] or box[1] >= box[3]:
+            continue
+        cx, cy = (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+        in_core = core[0] <= cx < core[2] and core[1] <= cy < core[3]
+        detections.append((box, text, touches_inner_edge(box, x, y, core, th, tw), in_core))
+    return detections
+
+
+def test_tile_offsets_landscape():
+    assert _tile_offsets(1584, 1280, 0.1) == [0, 304]
+    assert _tile_offsets(1224, 1280, 0.1) == [0]
+
+
+def test_tile_cores_split_overlaps_in_the_middle():
+    assert _tile_cores([0, 304], 1280) == [(-INF, 792.0), (792.0, INF)]
+    assert _tile_cores([0], 960) == [(-INF, INF)]
+
+
+def test_tile_portrait_page_is_only_cut_between_rows():
+    img = np.zeros((1584, 1224), dtype=np.uint8)
+    tiles = list(tile(img))
+
+    assert [(y, x) for y, x, _, _ in tiles] == [(0, 0), (624, 0)]
+    for _, _, _, crop in tiles:
+        assert crop.shape == (960, 1280)
+        # Padding past the page edge is white
+        assert (crop[:, 1224:] == 255).all()
+
+
+def test_tile_landscape_cores_cover_every_pixel_once():
+    img = np.zeros((1224, 1584, 3), dtype=np.uint8)
+    tiles = list(tile(img))
+
+    assert sorted((y, x) for y, x, _, _ in tiles) == [(0, 0), (0, 304), (264, 0), (264, 304)]
+    for py in range(0, 1224, 37):
+        for px in range(0, 1584, 37):
+            owners = [core for _, _, core, _ in tiles if core[0] <= px < core[2] and core[1] <= py < core[3]]
+            assert len(owners) == 1
+
+
+def test_line_across_landscape_seam_is_merged_once():
+    img = np.zeros((1224, 1584), dtype=np.uint8)
+    detections = detect_in_tiles(img, (100, 100, 1500, 130))
+
+    kept, seam_boxes = resolve_tile_detections(detections)
+
+    assert kept == []
+    assert seam_boxes == [(100, 100, 1500, 130)]
+
+
+def test_word_inside_overlap_is_kept_once():
+    img = np.zeros((1224, 1584), dtype=np.uint8)
+    detections = detect_in_tiles(img, (700, 100, 900, 130), "overlap")
+
+    kept, seam_boxes = resolve_tile_detections(detections)
+
+    assert kept == [((700, 100, 900, 130), "overlap")]
+    assert seam_boxes == []
+
+
+def test_cut_box_defers_to_a_tile_that_saw_the_whole_line():
+    detections = [
+        ((1200, 100, 1280, 130), "exam", True, True),
+        ((1200, 100, 1400, 130), "example", False, False),
+    ]
+
+    kept, seam_boxes = resolve_tile_detections(detections)
+
+    assert kept == [((1200, 100, 1400, 130), "example")]
+    assert seam_boxes == []
+
+
+def test_left_column_cut_by_a_vertical_seam_is_read_once():
+    img = np.zeros((1224, 1584), dtype=np.uint8)
+    detections = detect_in_tiles(img, (50, 600, 400, 620), "left")
+
+    kept, seam_boxes = resolve_tile_detections(detections)
+
+    assert kept == [((50, 600, 400, 620), "left")]
+    assert seam_boxes == []
+
+
+def test_group_lines_orders_boxes_left_to_right():
+    detections = [((230, 10, 330, 30), "world"), ((10, 12, 200, 32), "Hello")]
+
+    lines = group_lines(detections)
+
+    assert [texts for _, _, _, _, texts in lines] == [["Hello", "world"]]
+
+
+def test_group_lines_keeps_columns_apart():
+    detections = [
+        ((0, 0, 400, 20), "L1"),
+        ((500, 0, 900, 20), "R1"),
+        ((0, 30, 400, 50), "L2"),
+        ((500, 30, 900, 50), "R2"),
+    ]
+
+    lines = group_lines(detections)
+
+    assert [texts for _, _, _, _, texts in lines] == [["L1"], ["R1"], ["L2"], ["R2"]]
+    assert lines_to_text(lines) == "L1 L2\n\nR1 R2"
+
+
+def test_lines_to_text_splits_paragraphs_on_tall_gaps():
+    detections = [
+        ((10, 10, 200, 30), "first"),
+        ((10, 40, 200, 60), "line"),
+        ((10, 120, 200, 140), "second"),
+    ]
+
+    assert lines_to_text(group_lines(detections)) == "first line\n\nsecond"
+
+
+def test_lines_to_text_empty_page():
+    assert lines_to_text(group_lines([])) == ""